@@ -1,5 +1,6 @@
 """CLI - Group/Command classes."""
 
+import importlib
 from collections import OrderedDict
 
 import click.exceptions
@@ -92,3 +93,27 @@ class AliasGroup(DYMGroup):
     def format_commands(self, ctx, formatter):
         ctx.showing_help = True
         return super().format_commands(ctx, formatter)
+
+
+class LazyAliasGroup(AliasGroup):
+    """An alias group that only imports the modules for commands when needed.
+
+    Commands register themselves with the group when their module is imported,
+    so `lazy_modules` maps each command name (and alias) to the module that
+    defines it. Listing commands (e.g. for help) imports all of the modules.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.lazy_modules = kwargs.pop("lazy_modules", {})
+        super().__init__(*args, **kwargs)
+
+    def list_commands(self, ctx):
+        for module in set(self.lazy_modules.values()):
+            importlib.import_module(module)
+        return super().list_commands(ctx)
+
+    def get_command(self, ctx, cmd_name):
+        module = self.lazy_modules.get(cmd_name.split("|")[0])
+        if module:
+            importlib.import_module(module)
+        return super().get_command(ctx, cmd_name)
@@ -1,25 +1,5 @@
-"""CLI/Commands - Import all commands."""
+"""CLI/Commands - All commands.
 
-from . import (
-    check,
-    copy,
-    delete,
-    dependencies,
-    docs,
-    entitlements,
-    help_,
-    list_,
-    login,
-    metrics,
-    move,
-    policy,
-    push,
-    quarantine,
-    quota,
-    repos,
-    resync,
-    status,
-    tags,
-    upstream,
-    whoami,
-)
+Command modules register their commands with the main group when imported,
+which the main group does on demand (see `main.COMMAND_MODULES`).
+"""
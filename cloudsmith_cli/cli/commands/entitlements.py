@@ -99,7 +99,7 @@ def list_entitlements(ctx, opts, owner_repo, page, page_size, show_tokens):
 
     context_msg = "Failed to get list of entitlements!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             entitlements_, page_info = api.list_entitlements(
                 owner=owner,
                 repo=repo,
@@ -335,7 +335,7 @@ def create(ctx, opts, owner_repo, show_tokens, name, token):
 
     context_msg = "Failed to create the entitlement!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             entitlement = api.create_entitlement(
                 owner=owner, repo=repo, name=name, token=token, show_tokens=show_tokens
             )
@@ -466,7 +466,7 @@ def update(ctx, opts, owner_repo_identifier, show_tokens, name, token):
 
     context_msg = "Failed to update the entitlement!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             entitlement = api.update_entitlement(
                 owner=owner,
                 repo=repo,
@@ -542,7 +542,7 @@ def refresh(ctx, opts, owner_repo_identifier, show_tokens, yes):
 
     context_msg = "Failed to refresh the entitlement!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             entitlement = api.refresh_entitlement(
                 owner=owner, repo=repo, identifier=identifier, show_tokens=show_tokens
             )
@@ -628,7 +628,7 @@ def sync(ctx, opts, owner_repo, show_tokens, source, yes):
 
     context_msg = "Failed to sync the entitlements!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             entitlements_, page_info = api.sync_entitlements(
                 owner=owner, repo=repo, source=source, show_tokens=show_tokens
             )
@@ -800,7 +800,7 @@ def restrict(
 
     context_msg = "Failed to update the entitlement!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             entitlement = api.restrict_entitlement(
                 owner=owner, repo=repo, identifier=identifier, data=data
             )
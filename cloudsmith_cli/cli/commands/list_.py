@@ -6,15 +6,24 @@ from operator import itemgetter
 import click
 
 from ...core.api.distros import list_distros
-from ...core.api.packages import get_package_format_names_with_distros, list_packages
+from ...core.api.packages import (
+    get_package_format_names_with_distros,
+    iter_packages,
+    list_packages,
+)
 from .. import command, decorators, utils, validators
-from ..exceptions import handle_api_exceptions
-from ..utils import maybe_spinner
+from ..types import LazyChoice
 from . import dependencies, entitlements
 from .main import main
 from .repos import get as get_repos
 
 
+@functools.lru_cache(maxsize=1)
+def _get_distro_package_formats():
+    """Get the package formats that support distributions."""
+    return get_package_format_names_with_distros()
+
+
 @main.group(cls=command.AliasGroup, name="list", aliases=["ls"])
 @decorators.common_cli_config_options
 @decorators.common_cli_output_options
@@ -46,22 +55,16 @@ def dependencies_(*args, **kwargs):  # pylint: disable=missing-docstring
     "package-format",
     default=None,
     required=False,
-    type=click.Choice(get_package_format_names_with_distros()),
+    type=LazyChoice(_get_distro_package_formats),
 )
 @click.pass_context
 def distros(ctx, opts, package_format):
     """List available distributions."""
-    # Use stderr for messages if the output is something else (e.g.  # JSON)
-    use_stderr = opts.output != "pretty"
-
-    click.echo("Getting list of distributions ... ", nl=False, err=use_stderr)
-
     context_msg = "Failed to get list of distributions!"
-    with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
-            distros_ = list_distros(package_format=package_format)
-
-    click.secho("OK", fg="green", err=use_stderr)
+    with utils.status_block(
+        ctx, opts, "Getting list of distributions", context_msg=context_msg
+    ):
+        distros_ = list_distros(package_format=package_format)
 
     if utils.maybe_print_as_json(opts, distros_):
         return
@@ -70,38 +73,35 @@ def distros(ctx, opts, package_format):
     if package_format:
         headers.remove("Format")
 
-    rows = []
-    for distro in sorted(distros_, key=itemgetter("slug")):
-        if not distro["versions"]:
-            continue
+    ansi = utils.get_ansi_colors()
+    cyan, yellow, blue = ansi["cyan"], ansi["yellow"], ansi["blue"]
+    magenta, green, reset = ansi["magenta"], ansi["green"], ansi["reset"]
 
-        for release in sorted(distro["versions"], key=itemgetter("slug")):
-            row = [
-                click.style(distro["name"], fg="cyan"),
-                click.style(release["name"], fg="yellow"),
-                click.style(distro["format"], fg="blue"),
-                "%(distro)s/%(release)s"
-                % {
-                    "distro": click.style(distro["slug"], fg="magenta"),
-                    "release": click.style(release["slug"], fg="green"),
-                },
-            ]
+    slug_key = itemgetter("slug")
+    distros_with_releases = [distro for distro in distros_ if distro["versions"]]
+    distros_with_releases.sort(key=slug_key)
 
-            if package_format:
-                row.pop(2)  # Remove format column
+    def _iter_rows():
+        for distro in distros_with_releases:
+            releases = distro["versions"]
+            releases.sort(key=slug_key)
+            for release in releases:
+                row = [
+                    f"{cyan}{distro['name']}{reset}",
+                    f"{yellow}{release['name']}{reset}",
+                    f"{blue}{distro['format']}{reset}",
+                    f"{magenta}{distro['slug']}{reset}/{green}{release['slug']}{reset}",
+                ]
 
-            rows.append(row)
+                if package_format:
+                    row.pop(2)  # Remove format column
 
-    if distros_:
-        click.echo()
-        utils.pretty_print_table(headers, rows)
+                yield row
 
+    num_results = utils.pretty_print_result_table(headers, _iter_rows())
     click.echo()
 
-    num_results = sum(
-        1 for distro in distros_ for release in distro["versions"] if release
-    )
-    list_suffix = "distribution release%s" % ("s" if num_results != 1 else "")
+    list_suffix = f"distribution release{'s' if num_results != 1 else ''}"
     utils.pretty_print_list_info(num_results=num_results, suffix=list_suffix)
 
 
@@ -168,48 +168,36 @@ def packages(ctx, opts, owner_repo, page, page_size, query):
     """
     owner, repo = owner_repo
 
-    # Use stderr for messages if the output is something else (e.g.  # JSON)
-    use_stderr = opts.output != "pretty"
-
-    click.echo("Getting list of packages ... ", nl=False, err=use_stderr)
-
     context_msg = "Failed to get list of packages!"
-    with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
-            packages_, page_info = list_packages(
-                owner=owner, repo=repo, page=page, page_size=page_size, query=query
-            )
+    if opts.output == "ndjson":
+        pages = iter_packages(
+            owner=owner, repo=repo, page=page, page_size=page_size, query=query
+        )
+        utils.stream_as_ndjson(
+            ctx, opts, pages, "Getting list of packages", context_msg=context_msg
+        )
+        return
 
-    click.secho("OK", fg="green", err=use_stderr)
+    with utils.status_block(
+        ctx, opts, "Getting list of packages", context_msg=context_msg
+    ):
+        packages_, page_info = list_packages(
+            owner=owner, repo=repo, page=page, page_size=page_size, query=query
+        )
 
     if utils.maybe_print_as_json(opts, packages_, page_info):
         return
 
     headers = ["Name", "Version", "Status", "Owner / Repository (Identifier)"]
-    rows = []
-    for package in sorted(packages_, key=itemgetter("namespace", "slug")):
-        rows.append(
-            [
-                click.style(_get_package_name(package), fg="cyan"),
-                click.style(_get_package_version(package), fg="yellow"),
-                click.style(_get_package_status(package), fg="blue"),
-                "%(owner_slug)s/%(repo_slug)s/%(slug)s"
-                % {
-                    "owner_slug": click.style(package["namespace"], fg="magenta"),
-                    "repo_slug": click.style(package["repository"], fg="magenta"),
-                    "slug": click.style(package["slug"], fg="green"),
-                },
-            ]
-        )
-
-    if packages_:
-        click.echo()
-        utils.pretty_print_table(headers, rows)
+    # The API doesn't guarantee any ordering, so sort the page in place
+    packages_.sort(key=itemgetter("namespace", "slug"))
+    build_row = _make_package_row_builder(utils.get_ansi_colors())
+    rows = map(build_row, packages_)
 
+    num_results = utils.pretty_print_result_table(headers, rows)
     click.echo()
 
-    num_results = len(packages_)
-    list_suffix = "package%s visible" % ("s" if num_results != 1 else "")
+    list_suffix = f"package{'s' if num_results != 1 else ''} visible"
     utils.pretty_print_list_info(
         num_results=num_results, page_info=page_info, suffix=list_suffix
     )
@@ -245,6 +233,25 @@ def repos(ctx, opts, owner_repo, page, page_size):
     ctx.forward(get_repos)
 
 
+def _make_package_row_builder(ansi):
+    """Make a function that builds a table row for a package."""
+    cyan, yellow, blue = ansi["cyan"], ansi["yellow"], ansi["blue"]
+    magenta, green, reset = ansi["magenta"], ansi["green"], ansi["reset"]
+
+    def build_row(package):
+        """Build a table row for a package."""
+        return [
+            f"{cyan}{_get_package_name(package)}{reset}",
+            f"{yellow}{_get_package_version(package)}{reset}",
+            f"{blue}{_get_package_status(package)}{reset}",
+            f"{magenta}{package['namespace']}{reset}/"
+            f"{magenta}{package['repository']}{reset}/"
+            f"{green}{package['slug']}{reset}",
+        ]
+
+    return build_row
+
+
 def _get_package_name(package):
     """Get the name (or filename) for a package."""
     return package["name"] or package["filename"]
@@ -9,6 +9,44 @@ from .. import command, decorators
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
+# The modules that define each command (and alias), imported on first use.
+COMMAND_MODULES = {
+    "check": "check",
+    "copy": "copy",
+    "cp": "copy",
+    "delete": "delete",
+    "rm": "delete",
+    "dependencies": "dependencies",
+    "deps": "dependencies",
+    "docs": "docs",
+    "entitlements": "entitlements",
+    "ents": "entitlements",
+    "help": "help_",
+    "list": "list_",
+    "ls": "list_",
+    "login": "login",
+    "token": "login",
+    "metrics": "metrics",
+    "move": "move",
+    "mv": "move",
+    "promote": "move",
+    "policy": "policy",
+    "push": "push",
+    "upload": "push",
+    "deploy": "push",
+    "quarantine": "quarantine",
+    "block": "quarantine",
+    "quota": "quota",
+    "repositories": "repos",
+    "repos": "repos",
+    "resync": "resync",
+    "status": "status",
+    "tags": "tags",
+    "tag": "tags",
+    "upstream": "upstream",
+    "whoami": "whoami",
+}
+
 
 def print_version():
     """Print the environment versions."""
@@ -24,7 +62,10 @@ def print_version():
 
 
 @click.group(
-    cls=command.AliasGroup,
+    cls=command.LazyAliasGroup,
+    lazy_modules={
+        name: f"{__package__}.{module}" for name, module in COMMAND_MODULES.items()
+    },
     context_settings=CONTEXT_SETTINGS,
     invoke_without_command=True,
     help="""\b
@@ -125,7 +125,7 @@ def usage(ctx, opts, owner_repo, tokens, start, finish):
 
     context_msg = "Failed to get list of metrics!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             if owner and repo:
                 data = api.get_repository_entitlements_metrics(
                     owner=owner, repo=repo, tokens=tokens, start=start, finish=finish
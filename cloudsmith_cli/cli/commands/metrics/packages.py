@@ -118,7 +118,7 @@ def usage(ctx, opts, owner_repo, packages, start, finish):
 
     context_msg = "Failed to get list of metrics!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             data = api.get_repository_packages_metrics(
                 owner=owner, repo=repo, packages=packages, start=start, finish=finish
             )
@@ -110,7 +110,7 @@ def ls(ctx, opts, owner, page, page_size):
 
     context_msg = "Failed to get license policies!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             policies, page_info = api.list_license_policies(
                 owner=owner, page=page, page_size=page_size
             )
@@ -187,7 +187,7 @@ def create(ctx, opts, owner, policy_config_file):
 
     context_msg = "Failed to create the license policy!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             policies = [api.create_license_policy(owner, policy_config)]
 
     click.secho("OK", fg="green", err=use_stderr)
@@ -256,7 +256,7 @@ def update(ctx, opts, owner, identifier, policy_config_file):
 
     context_msg = "Failed to update the license policy!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             policies = [api.update_license_policy(owner, identifier, policy_config)]
 
     click.secho("OK", fg="green", err=use_stderr)
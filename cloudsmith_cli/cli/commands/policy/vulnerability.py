@@ -98,7 +98,7 @@ def ls(ctx, opts, owner, page, page_size):
 
     context_msg = "Failed to get package vulnerability policies!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             policies, page_info = api.list_vulnerability_policies(
                 owner=owner, page=page, page_size=page_size
             )
@@ -169,7 +169,7 @@ def create(ctx, opts, owner, policy_config_file):
 
     context_msg = "Failed to create the vulnerability policy!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             policies = [api.create_vulnerability_policy(owner, policy_config)]
 
     click.secho("OK", fg="green", err=use_stderr)
@@ -238,7 +238,7 @@ def update(ctx, opts, owner, identifier, policy_config_file):
 
     context_msg = "Failed to update the vulnerability policy!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             policies = [
                 api.update_vulnerability_policy(owner, identifier, policy_config)
             ]
@@ -84,7 +84,7 @@ def add_quarantine(ctx, opts, owner_repo_package, page, page_size):
 
     context_msg = "Failed quarantine!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             api.quarantine_package(owner=owner, repo=repo, identifier=slug)
 
     click.secho("OK", fg="green", err=use_stderr)
@@ -131,7 +131,7 @@ def remove_quarantine(ctx, opts, owner_repo_package, page, page_size):
 
     context_msg = "Failed quarantine!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             api.quarantine_restore_package(owner=owner, repo=repo, identifier=slug)
 
     click.secho("OK", fg="green", err=use_stderr)
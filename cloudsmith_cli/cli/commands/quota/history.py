@@ -111,7 +111,7 @@ def usage(ctx, opts, owner, oss):
 
     context_msg = "Failed to get quota!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             quota_ = api.quota_history(owner=owner, oss=oss)
 
     click.secho("OK", fg="green", err=use_stderr)
@@ -24,32 +24,29 @@ def print_repositories(opts, data, page_info=None, show_list_info=True):
         "Owner / Repository (Identifier)",
     ]
 
-    rows = []
-    for repo in sorted(data, key=itemgetter("namespace", "slug")):
-        rows.append(
-            [
-                click.style(repo["name"], fg="cyan"),
-                click.style(repo["repository_type_str"], fg="yellow"),
-                click.style(str(repo["package_count"]), fg="blue"),
-                click.style(str(repo["package_group_count"]), fg="blue"),
-                click.style(str(repo["num_downloads"]), fg="blue"),
-                click.style(str(repo["size_str"]), fg="blue"),
-                "%(owner_slug)s/%(slug)s"
-                % {
-                    "owner_slug": click.style(repo["namespace"], fg="magenta"),
-                    "slug": click.style(repo["slug"], fg="green"),
-                },
-            ]
-        )
-
-    if data:
-        click.echo()
-        utils.pretty_print_table(headers, rows)
+    ansi = utils.get_ansi_colors()
+    cyan, yellow, blue = ansi["cyan"], ansi["yellow"], ansi["blue"]
+    magenta, green, reset = ansi["magenta"], ansi["green"], ansi["reset"]
+
+    # The API doesn't guarantee any ordering, so sort the page in place
+    data.sort(key=itemgetter("namespace", "slug"))
+    rows = (
+        [
+            f"{cyan}{repo['name']}{reset}",
+            f"{yellow}{repo['repository_type_str']}{reset}",
+            f"{blue}{repo['package_count']}{reset}",
+            f"{blue}{repo['package_group_count']}{reset}",
+            f"{blue}{repo['num_downloads']}{reset}",
+            f"{blue}{repo['size_str']}{reset}",
+            f"{magenta}{repo['namespace']}{reset}/{green}{repo['slug']}{reset}",
+        ]
+        for repo in data
+    )
 
+    num_results = utils.pretty_print_result_table(headers, rows)
     click.echo()
 
-    num_results = len(data)
-    list_suffix = "repositor%s visible" % ("ies" if num_results != 1 else "y")
+    list_suffix = f"repositor{'ies' if num_results != 1 else 'y'} visible"
     utils.pretty_print_list_info(
         num_results=num_results, page_info=page_info, suffix=list_suffix
     )
@@ -96,11 +93,6 @@ def get(ctx, opts, owner_repo, page, page_size):
     If OWNER isn't specified it'll default to the currently authenticated user
     (if any). If you're unauthenticated, no results will be returned.
     """
-    # Use stderr for messages if the output is something else (e.g.  # JSON)
-    use_stderr = opts.output != "pretty"
-
-    click.echo("Getting list of repositories ... ", nl=False, err=use_stderr)
-
     if isinstance(owner_repo, list):
         if len(owner_repo) == 1:
             owner = owner_repo[0]
@@ -116,13 +108,19 @@ def get(ctx, opts, owner_repo, page, page_size):
             owner = None
 
     context_msg = "Failed to get list of repositories!"
-    with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
-            repos_, page_info = api.list_repos(
-                owner=owner, repo=repo, page=page, page_size=page_size
-            )
+    if opts.output == "ndjson":
+        pages = api.iter_repos(owner=owner, repo=repo, page=page, page_size=page_size)
+        utils.stream_as_ndjson(
+            ctx, opts, pages, "Getting list of repositories", context_msg=context_msg
+        )
+        return
 
-    click.secho("OK", fg="green", err=use_stderr)
+    with utils.status_block(
+        ctx, opts, "Getting list of repositories", context_msg=context_msg
+    ):
+        repos_, page_info = api.list_repos(
+            owner=owner, repo=repo, page=page, page_size=page_size
+        )
 
     if utils.maybe_print_as_json(opts, repos_, page_info):
         return
@@ -185,7 +183,7 @@ def create(ctx, opts, owner, repo_config_file):
 
     context_msg = "Failed to create the repository!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             repository = api.create_repo(owner, repo_config)
 
     click.secho("OK", fg="green", err=use_stderr)
@@ -245,7 +243,7 @@ def update(ctx, opts, owner_repo, repo_config_file):
 
     context_msg = "Failed to update the repository!"
     with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-        with maybe_spinner(opts):
+        with maybe_spinner(opts, err=use_stderr):
             repository = api.update_repo(owner, repo, repo_config)
 
     click.secho("OK", fg="green", err=use_stderr)
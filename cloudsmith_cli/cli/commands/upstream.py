@@ -167,7 +167,7 @@ def build_upstream_list_command(upstream_fmt):
 
         context_msg = "Failed to get upstreams!"
         with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-            with maybe_spinner(opts):
+            with maybe_spinner(opts, err=use_stderr):
                 upstreams, page_info = api.list_upstreams(
                     owner=owner,
                     repo=repo,
@@ -238,7 +238,7 @@ def build_upstream_create_command(upstream_fmt):
         context_msg = "Failed to create the upstream!"
 
         with handle_api_exceptions(ctx, opts, context_msg=context_msg):
-            with maybe_spinner(opts):
+            with maybe_spinner(opts, err=use_stderr):
                 upstream_resp_data = api.create_upstream(
                     owner, repo, upstream_fmt, upstream_config
                 )
@@ -317,7 +317,7 @@ def build_upstream_update_command(upstream_fmt):
 
         context_msg = "Failed to update the upstream!"
         with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-            with maybe_spinner(opts):
+            with maybe_spinner(opts, err=use_stderr):
                 upstream_resp_data = api.update_upstream(
                     owner, repo, slug_perm, upstream_fmt, upstream_config
                 )
@@ -409,7 +409,7 @@ def build_upstream_delete_command(upstream_fmt):
 
         context_msg = "Failed to delete the upstream!"
         with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
-            with maybe_spinner(opts):
+            with maybe_spinner(opts, err=use_stderr):
                 api.delete_upstream(owner, repo, upstream_fmt, slug_perm)
 
         click.secho("OK", fg="green", err=use_stderr)
@@ -116,9 +116,12 @@ def common_cli_output_options(f):
         "-F",
         "--output-format",
         default="pretty",
-        type=click.Choice(["pretty", "json", "pretty_json"]),
+        type=click.Choice(["pretty", "json", "pretty_json", "ndjson"]),
         help="Determines how output is formatted. This is only supported by a "
-        "subset of the commands at the moment (e.g. list).",
+        "subset of the commands at the moment (e.g. list). The ndjson format "
+        "prints one JSON object per line. For packages and repositories it "
+        "streams every page from --page onwards; elsewhere it prints one page "
+        "and writes the pagination details to stderr.",
     )
     @click.option(
         "-v",
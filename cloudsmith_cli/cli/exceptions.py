@@ -2,7 +2,6 @@
 
 import collections
 import contextlib
-import sys
 
 import click
 
@@ -28,13 +27,10 @@ def handle_api_exceptions(
             click.secho("ERROR", fg="red", err=use_stderr)
 
         context_msg = context_msg or "Failed to perform operation!"
+        status = exc.status
+        status_description = exc.status_description
         click.secho(
-            "%(context)s (status: %(code)s - %(code_text)s)"
-            % {
-                "context": context_msg,
-                "code": exc.status,
-                "code_text": exc.status_description,
-            },
+            f"{context_msg} (status: {status} - {status_description})",
             fg="red",
             err=use_stderr,
         )
@@ -45,23 +41,18 @@ def handle_api_exceptions(
 
             if detail:
                 click.secho(
-                    "Detail: %(detail)s"
-                    % {"detail": click.style(detail, fg="red", bold=False)},
+                    f"Detail: {click.style(detail, fg='red', bold=False)}",
                     bold=True,
                     err=use_stderr,
                 )
 
             if fields:
+                lines = []
                 for k, v in fields.items():
-                    field = "%s Field" % k.capitalize()
-                    click.secho(
-                        "%(field)s: %(message)s"
-                        % {
-                            "field": click.style(field, bold=True),
-                            "message": click.style(v, fg="red"),
-                        },
-                        err=use_stderr,
-                    )
+                    field = click.style(f"{k.capitalize()} Field", bold=True)
+                    message = click.style(v, fg="red")
+                    lines.append(f"{field}: {message}")
+                click.echo("\n".join(lines), err=use_stderr)
 
         hint = get_error_hint(ctx, opts, exc)
         if hint:
@@ -72,16 +63,15 @@ def handle_api_exceptions(
 
         if opts.verbose and not opts.debug:
             if exc.headers:
-                click.echo(err=use_stderr)
-                click.echo("Headers in Reply:", err=use_stderr)
-                for k, v in exc.headers.items():
-                    click.echo(f"{k} = {v}", err=use_stderr)
+                lines = ["", "Headers in Reply:"]
+                lines.extend(f"{k} = {v}" for k, v in exc.headers.items())
+                click.echo("\n".join(lines), err=use_stderr)
 
         if reraise_on_error:
             raise
 
         if exit_on_error:
-            ctx.exit(exc.status or 1)
+            ctx.exit(status or 1)
 
 
 def get_details(exc):
@@ -116,8 +106,7 @@ def get_details(exc):
 
 def get_error_hint(ctx, opts, exc):
     """Get a hint to show to the user (if any)."""
-    module = sys.modules[__name__]
-    get_specific_error_hint = getattr(module, "get_%s_error_hint" % exc.status, None)
+    get_specific_error_hint = ERROR_HINTS.get(exc.status)
     if get_specific_error_hint:
         return get_specific_error_hint(ctx, opts, exc)
     return None
@@ -164,3 +153,10 @@ def get_500_error_hint(ctx, opts, exc):
         "issues, either with this specific command or as a whole. "
         "Please accept our apologies and try again later."
     )
+
+
+ERROR_HINTS = {
+    401: get_401_error_hint,
+    404: get_404_error_hint,
+    500: get_500_error_hint,
+}
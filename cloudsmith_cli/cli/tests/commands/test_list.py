@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from ....core.api.exceptions import ApiException
+from ....core.pagination import PageInfo
+from ...commands import list_ as list_module
+from ...commands.list_ import _make_package_row_builder, list_
+from ...utils import ANSI_COLORS, ANSI_COLORS_PLAIN
+
+
+@pytest.fixture()
+def package():
+    return {
+        "name": None,
+        "filename": "foo.tar.gz",
+        "version": "1.0",
+        "status_str": "Completed",
+        "stage_str": "Fully Synchronised",
+        "namespace": "org",
+        "repository": "repo",
+        "slug": "foo-abc",
+    }
+
+
+def test_package_row_builder_plain(package):
+    build_row = _make_package_row_builder(ANSI_COLORS_PLAIN)
+    assert build_row(package) == [
+        "foo.tar.gz",
+        "1.0",
+        "Completed",
+        "org/repo/foo-abc",
+    ]
+
+
+def test_package_row_builder_styled(package):
+    build_row = _make_package_row_builder(ANSI_COLORS)
+    row = build_row(package)
+    assert row[0] == "\x1b[36mfoo.tar.gz\x1b[0m"
+    assert row[3] == "\x1b[35morg\x1b[0m/\x1b[35mrepo\x1b[0m/\x1b[32mfoo-abc\x1b[0m"
+
+
+def test_list_packages_ndjson_error_mid_stream(runner, monkeypatch, package):
+    def iter_packages(**kwargs):
+        yield [package], None
+        raise ApiException(500, detail="Oops.")
+
+    monkeypatch.setattr(list_module, "iter_packages", iter_packages)
+
+    result = runner.invoke(list_, args=["pkgs", "org/repo", "-F", "ndjson"])
+
+    assert result.exit_code == 500
+    assert [json.loads(line) for line in result.stdout.splitlines()] == [package]
+    assert result.stderr.startswith("Getting list of packages ... ERROR\n")
+    assert "Failed to get list of packages! (status: 500" in result.stderr
+    assert "Detail: Oops." in result.stderr
+
+
+@pytest.mark.parametrize("args", [["distros"], ["pkgs", "org/repo"]])
+def test_list_ndjson_unserializable(runner, monkeypatch, package, args):
+    unserializable = dict(package, slug=object())
+    monkeypatch.setattr(list_module, "list_distros", lambda **kwargs: [unserializable])
+    monkeypatch.setattr(
+        list_module, "iter_packages", lambda **kwargs: iter([([unserializable], None)])
+    )
+
+    result = runner.invoke(list_, args=[*args, "-F", "ndjson"])
+
+    assert result.exit_code == 1
+    assert result.stdout == ""
+    assert "Failed to convert to JSON" in result.stderr
+
+
+def test_list_entitlements_ndjson_shows_pagination(runner, monkeypatch):
+    def list_entitlements(**kwargs):
+        page_info = PageInfo()
+        page_info.count = 3
+        page_info.page = 1
+        page_info.page_size = 2
+        page_info.page_total = 2
+        return [{"name": "foo"}, {"name": "bar"}], page_info
+
+    monkeypatch.setattr(
+        list_module.entitlements.api, "list_entitlements", list_entitlements
+    )
+
+    result = runner.invoke(
+        list_, args=["entitlements", "org/repo", "-F", "ndjson", "--page-size", "2"]
+    )
+
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.stdout.splitlines()] == [
+        {"name": "foo"},
+        {"name": "bar"},
+    ]
+    # Only one page is printed, so the pagination details go to stderr
+    assert "Results: 1-2 (2) of 3 item(s) (page: 1/2, page size: 2)" in result.stderr
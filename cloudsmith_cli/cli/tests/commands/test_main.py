@@ -1,8 +1,14 @@
+import importlib
+import importlib.util
+import pkgutil
+
+import click
 import pytest
 
 from ....core.api.version import get_version as get_api_version
 from ....core.version import get_version
-from ...commands.main import main
+from ... import commands
+from ...commands.main import COMMAND_MODULES, main
 
 
 class TestMainCommand:
@@ -24,3 +30,18 @@ class TestMainCommand:
         assert result.exit_code == 0
         # TODO: assert something specific about output
         assert result.output
+
+    def test_main_command_modules(self):
+        """Test that every command and alias is mapped to its module."""
+        # Import every command module, including any missing from the mapping
+        for module_info in pkgutil.walk_packages(
+            commands.__path__, prefix=f"{commands.__name__}."
+        ):
+            importlib.import_module(module_info.name)
+
+        ctx = click.Context(main)
+        assert set(main.list_commands(ctx)) == set(COMMAND_MODULES)
+
+        for name, module in COMMAND_MODULES.items():
+            assert main.get_command(ctx, name) is not None
+            assert importlib.util.find_spec(f"{commands.__name__}.{module}")
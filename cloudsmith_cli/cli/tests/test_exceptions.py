@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+import pytest
+
+from ...core.api.exceptions import ApiException
+from ..exceptions import get_404_error_hint, get_error_hint, handle_api_exceptions
+
+
+@pytest.mark.parametrize("status", [401, 404, 500])
+def test_get_error_hint_for_known_status(status):
+    ctx = SimpleNamespace(info_name="list")
+    opts = SimpleNamespace(api_key=None)
+    exc = SimpleNamespace(status=status)
+    assert get_error_hint(ctx, opts, exc)
+
+
+def test_get_error_hint_dispatches_on_status():
+    exc = SimpleNamespace(status=404)
+    assert get_error_hint(None, None, exc) == get_404_error_hint(None, None, exc)
+
+
+@pytest.mark.parametrize("status", [None, 400, 503])
+def test_get_error_hint_for_unknown_status(status):
+    assert get_error_hint(None, None, SimpleNamespace(status=status)) is None
+
+
+def test_handle_api_exceptions_output(capsys):
+    ctx = SimpleNamespace(info_name="list", exit=lambda code: None)
+    opts = SimpleNamespace(output="pretty", verbose=True, debug=False, api_key="x")
+    exc = ApiException(
+        400,
+        detail="Invalid input.",
+        headers={"X-Request-Id": "abc"},
+        fields={"name": ["This field is required."], "version": "Bad version."},
+    )
+
+    with handle_api_exceptions(ctx, opts, context_msg="Failed!"):
+        raise exc
+
+    assert capsys.readouterr().out.splitlines() == [
+        "ERROR",
+        "Failed! (status: 400 - Bad Request)",
+        "",
+        "Detail: Invalid input.",
+        "Name Field: This field is required.",
+        "Version Field: Bad version.",
+        "",
+        "Headers in Reply:",
+        "X-Request-Id = abc",
+    ]
@@ -0,0 +1,67 @@
+import click
+import pytest
+
+from ..types import LazyChoice
+
+
+def test_lazy_choice_builds_choices_on_first_use():
+    calls = []
+
+    def get_choices():
+        calls.append(True)
+        return ["deb", "rpm"]
+
+    choice = LazyChoice(get_choices)
+    assert not calls
+
+    assert choice.convert("deb", None, None) == "deb"
+    assert choice.convert("rpm", None, None) == "rpm"
+    assert choice.choices == ("deb", "rpm")
+    assert len(calls) == 1
+
+
+def test_lazy_choice_rejects_invalid_choice():
+    choice = LazyChoice(lambda: ["deb", "rpm"])
+    with pytest.raises(click.BadParameter):
+        choice.convert("foo", None, None)
+
+
+def test_lazy_choice_with_iterating_choice_init(monkeypatch):
+    """Newer versions of click convert the choices to a tuple on init."""
+
+    def choice_init(self, choices, case_sensitive=True):
+        self.choices = tuple(choices)
+        self.case_sensitive = case_sensitive
+
+    monkeypatch.setattr(click.Choice, "__init__", choice_init)
+
+    choice = LazyChoice(lambda: ["deb", "rpm"])
+    assert choice.choices == ("deb", "rpm")
+    assert choice.convert("deb", None, None) == "deb"
+
+
+def test_lazy_choice_in_command(runner):
+    calls = []
+
+    def get_choices():
+        calls.append(True)
+        return ["deb", "rpm"]
+
+    @click.command()
+    @click.argument("package-format", type=LazyChoice(get_choices))
+    def cmd(package_format):
+        click.echo(package_format)
+
+    assert not calls
+
+    result = runner.invoke(cmd, ["--help"])
+    assert result.exit_code == 0
+    assert "deb|rpm" in result.output
+
+    result = runner.invoke(cmd, ["rpm"])
+    assert result.exit_code == 0
+    assert result.output == "rpm\n"
+
+    result = runner.invoke(cmd, ["foo"])
+    assert result.exit_code == 2
+    assert len(calls) == 1
@@ -1,6 +1,20 @@
+import io
+import json
+from contextlib import contextmanager
+from types import SimpleNamespace
+
 import pytest
+from click.utils import strip_ansi
 
-from ..utils import maybe_truncate_list, maybe_truncate_string
+from ..utils import (
+    format_table_rows,
+    maybe_print_as_json,
+    maybe_spinner,
+    maybe_truncate_list,
+    maybe_truncate_string,
+    pretty_print_result_table,
+    stream_as_ndjson,
+)
 
 
 @pytest.mark.parametrize(
@@ -33,3 +47,112 @@ def test_maybe_truncate_string(data, max_length, expected_len):
 
     if expected_len > max_length:
         assert truncated[-4:-1] == "..."
+
+
+def test_pretty_print_result_table(capsys):
+    headers = ["Name", "Version"]
+    rows = (row for row in [["foo", "1.0"], ["barbaz", "10.0.0-rc1"]])
+
+    assert pretty_print_result_table(headers, rows) == 2
+    assert capsys.readouterr().out.split("\n") == [
+        "",
+        "Name   | Version   ",
+        "foo    | 1.0       ",
+        "barbaz | 10.0.0-rc1",
+        "",
+    ]
+
+
+def test_pretty_print_result_table_no_rows(capsys):
+    assert pretty_print_result_table(["Name"], iter([])) == 0
+    assert capsys.readouterr().out == ""
+
+
+class _ApiObject:
+    """Stand-in for an API model object."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def to_dict(self):
+        return dict(self.kwargs)
+
+
+@pytest.mark.parametrize("output", ["json", "pretty_json"])
+def test_maybe_print_as_json(capsys, output):
+    opts = SimpleNamespace(output=output)
+    data = [{"slug": "foo"}, _ApiObject(slug="bar")]
+
+    assert maybe_print_as_json(opts, data)
+    assert json.loads(capsys.readouterr().out) == {
+        "data": [{"slug": "foo"}, {"slug": "bar"}]
+    }
+
+
+def test_maybe_print_as_json_pretty_output(capsys):
+    opts = SimpleNamespace(output="pretty")
+    assert not maybe_print_as_json(opts, [{"slug": "foo"}])
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("output", ["json", "pretty_json"])
+def test_maybe_print_as_json_unserializable(capsys, output):
+    opts = SimpleNamespace(output=output)
+    data = [{"a": 1}, {"b": object()}]
+
+    assert maybe_print_as_json(opts, data)
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Failed to convert to JSON" in captured.err
+
+
+def test_format_table_rows():
+    lines = list(format_table_rows(["Name", "Version"], [["foo", "1.0"]]))
+    assert [strip_ansi(line) for line in lines] == [
+        "Name | Version",
+        "foo  | 1.0    ",
+    ]
+
+
+def test_maybe_print_as_json_ndjson(capsys):
+    opts = SimpleNamespace(output="ndjson")
+    data = [{"slug": "foo", "num": 1}, _ApiObject(slug="bar")]
+
+    assert maybe_print_as_json(opts, data)
+    assert capsys.readouterr().out == '{"num":1,"slug":"foo"}\n{"slug":"bar"}\n'
+
+
+def test_stream_as_ndjson(capsys):
+    opts = SimpleNamespace(output="ndjson")
+    pages = iter([([{"slug": "foo"}], None), ([], None), ([{"slug": "bar"}], None)])
+
+    stream_as_ndjson(None, opts, pages, "Getting list of things")
+    captured = capsys.readouterr()
+    lines = captured.out.splitlines()
+    assert [json.loads(line) for line in lines] == [{"slug": "foo"}, {"slug": "bar"}]
+    assert captured.err == "Getting list of things ... OK\n"
+
+
+class _TtyStream(io.StringIO):
+    def isatty(self):
+        return True
+
+
+@pytest.mark.parametrize("err", [False, True])
+def test_maybe_spinner_uses_requested_stream(monkeypatch, err):
+    stdout, stderr = _TtyStream(), _TtyStream()
+    monkeypatch.setattr("sys.stdout", stdout)
+    monkeypatch.setattr("sys.stderr", stderr)
+    streams = []
+
+    @contextmanager
+    def spinner(stream):
+        streams.append(stream)
+        yield
+
+    monkeypatch.setattr("click_spinner.spinner", spinner)
+
+    with maybe_spinner(SimpleNamespace(debug=False), err=err):
+        pass
+
+    assert streams == [stderr if err else stdout]
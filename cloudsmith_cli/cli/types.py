@@ -12,3 +12,25 @@ class ExpandPath(click.Path):
         """Take a path with $HOME variables and resolve it to full path."""
         value = os.path.expanduser(value)
         return super().convert(value, *args, **kwargs)
+
+
+class LazyChoice(click.Choice):
+    """Extends Choice to defer building the choices until they're needed."""
+
+    def __init__(self, get_choices, case_sensitive=True):
+        super().__init__((), case_sensitive=case_sensitive)
+        # Set after initialising, as Choice.__init__ sets the (empty) choices
+        self._get_choices = get_choices
+
+    @property
+    def choices(self):
+        """Get the choices, building them on first access."""
+        if self._get_choices is not None:
+            self._choices = tuple(self._get_choices())
+            self._get_choices = None
+        return self._choices
+
+    @choices.setter
+    def choices(self, value):
+        self._choices = value
+        self._get_choices = None
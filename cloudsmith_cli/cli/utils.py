@@ -2,16 +2,32 @@
 
 import json
 import platform
+import sys
 from contextlib import contextmanager
 from datetime import date, datetime
 
 import click
-from click_spinner import spinner
 
 from ..core.api.version import get_version as get_api_version
 from ..core.version import get_version as get_cli_version
+from .exceptions import handle_api_exceptions
 from .table import make_table
 
+# ANSI escape sequences for foreground colours, for hot paths (such as table
+# rows) where calling click.style() for every value is too expensive.
+ANSI_COLORS = {
+    "black": "\x1b[30m",
+    "red": "\x1b[31m",
+    "green": "\x1b[32m",
+    "yellow": "\x1b[33m",
+    "blue": "\x1b[34m",
+    "magenta": "\x1b[35m",
+    "cyan": "\x1b[36m",
+    "white": "\x1b[37m",
+    "reset": "\x1b[0m",
+}
+ANSI_COLORS_PLAIN = dict.fromkeys(ANSI_COLORS, "")
+
 
 def make_user_agent(prefix=None):
     """Get a suitable user agent for identifying the CLI process."""
@@ -19,7 +35,7 @@ def make_user_agent(prefix=None):
     return f"cloudsmith-cli/{prefix} cli:{get_cli_version()} api:{get_api_version()}"
 
 
-def pretty_print_list_info(num_results, page_info=None, suffix=None):
+def pretty_print_list_info(num_results, page_info=None, suffix=None, err=False):
     """Pretty print list info, with pagination, for user display."""
     num_results_fg = "green" if num_results else "red"
     num_results_text = click.style(str(num_results), fg=num_results_fg)
@@ -43,10 +59,24 @@ def pretty_print_list_info(num_results, page_info=None, suffix=None):
             "range_results": range_results_text,
             "page_info": " (%s)" % page_info_text if page_info_text else "",
             "suffix": suffix or "item(s)",
-        }
+        },
+        err=err,
     )
 
 
+def should_style_output():
+    """Check if output to stdout should be styled with ANSI colours."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and ctx.color is not None:
+        return ctx.color
+    return sys.stdout.isatty()
+
+
+def get_ansi_colors():
+    """Get the ANSI colour sequences to use when styling output to stdout."""
+    return ANSI_COLORS if should_style_output() else ANSI_COLORS_PLAIN
+
+
 def fmt_datetime(value):
     """Convert a datetime value to string."""
     if isinstance(value, (date, datetime)):
@@ -61,26 +91,47 @@ def fmt_bool(value):
     return value
 
 
-def pretty_print_table(headers, rows, title=None):
-    """Pretty print a table from headers and rows."""
+def _format_row(styled, plain, column_widths):
+    """Format a row, padded to the column widths."""
+    return " | ".join(
+        v + " " * (column_widths[k] - len(plain[k])) for k, v in enumerate(styled)
+    )
+
+
+def format_table_rows(headers, rows):
+    """Format a table from headers and rows, yielding each line as a string."""
     table = make_table(headers=headers, rows=rows)
 
-    def pretty_print_row(styled, plain):
-        """Pretty print a row."""
-        click.secho(
-            " | ".join(
-                v + " " * (table.column_widths[k] - len(plain[k]))
-                for k, v in enumerate(styled)
-            )
-        )
+    yield _format_row(table.headers, table.plain_headers, table.column_widths)
+    for k, row in enumerate(table.rows):
+        yield _format_row(row, table.plain_rows[k], table.column_widths)
+
+
+def pretty_print_table(headers, rows, title=None):
+    """Pretty print a table from headers and rows."""
+    lines = []
 
     if title:
-        click.secho(title, fg="white", bold=True)
-        click.secho("-" * 80, fg="yellow")
+        lines.append(click.style(title, fg="white", bold=True))
+        lines.append(click.style("-" * 80, fg="yellow"))
 
-    pretty_print_row(table.headers, table.plain_headers)
-    for k, row in enumerate(table.rows):
-        pretty_print_row(row, table.plain_rows[k])
+    lines.extend(format_table_rows(headers, rows))
+
+    # Output the whole table in a single write
+    click.echo("\n".join(lines))
+
+
+def pretty_print_result_table(headers, rows):
+    """Pretty print a table of results, preceded by a blank line, if any.
+
+    Returns the number of rows, so that callers can pass in an iterable of
+    rows (e.g. a generator) without having to count them separately.
+    """
+    rows = list(rows)
+    if rows:
+        click.echo()
+        pretty_print_table(headers, rows)
+    return len(rows)
 
 
 def print_rate_limit_info(opts, rate_info):
@@ -115,7 +166,8 @@ def json_serializer(obj):
 
 def maybe_print_as_json(opts, data, page_info=None):
     """Maybe print data as JSON."""
-    if opts.output not in ("json", "pretty_json"):
+    output = opts.output
+    if output not in ("json", "pretty_json", "ndjson"):
         return False
 
     # Attempt to convert the data to dicts (usually from API objects)
@@ -126,11 +178,29 @@ def maybe_print_as_json(opts, data, page_info=None):
 
     if isinstance(data, list):
         for k, item in enumerate(data):
+            if isinstance(item, dict):
+                # List endpoints usually return dicts already, so skip the
+                # (comparatively expensive) failed attribute lookup.
+                continue
+
             try:
                 data[k] = item.to_dict()
             except AttributeError:
                 pass
 
+    if output == "ndjson":
+        rows = data if isinstance(data, list) else [data]
+        try:
+            print_as_ndjson(rows)
+        except (TypeError, ValueError) as e:
+            exit_on_ndjson_error(click.get_current_context(), e)
+
+        if page_info is not None and page_info.is_valid:
+            # Only this page is printed, so say which page it was (and how
+            # many there are) on stderr, where it won't mix with the results.
+            pretty_print_list_info(num_results=len(rows), page_info=page_info, err=True)
+        return True
+
     root = {"data": data}
 
     if page_info is not None and page_info.is_valid:
@@ -138,7 +208,9 @@ def maybe_print_as_json(opts, data, page_info=None):
         meta["pagination"] = page_info.as_dict(num_results=len(data))
 
     try:
-        if opts.output == "pretty_json":
+        # Serialise the whole document before writing anything, so that a
+        # failure part way through doesn't leave invalid JSON on stdout.
+        if output == "pretty_json":
             dump = json.dumps(root, indent=4, sort_keys=True, default=json_serializer)
         else:
             dump = json.dumps(root, sort_keys=True, default=json_serializer)
@@ -150,6 +222,44 @@ def maybe_print_as_json(opts, data, page_info=None):
     return True
 
 
+def print_as_ndjson(data):
+    """Print a list of results as newline-delimited JSON, one result per line."""
+    encode = json.JSONEncoder(
+        sort_keys=True, separators=(",", ":"), default=json_serializer
+    ).encode
+
+    stdout = click.get_text_stream("stdout")
+    stdout.write("".join(f"{encode(item)}\n" for item in data))
+    stdout.flush()
+
+
+def exit_on_ndjson_error(ctx, exc):
+    """Report results that couldn't be converted to JSON, and exit.
+
+    Earlier lines of newline-delimited JSON may already have been written, so
+    exit with an error to tell the consumer that the output is incomplete.
+    """
+    click.secho(f"Failed to convert to JSON: {str(exc)}", fg="red", err=True)
+    ctx.exit(1)
+
+
+def stream_as_ndjson(ctx, opts, pages, message, context_msg=None):
+    """Print pages of results as newline-delimited JSON as they're fetched.
+
+    Each page is printed as soon as it arrives, so the first results are
+    available to the consumer (e.g. a pipe) before the last page is fetched.
+    The status message goes to stderr (as with other non-pretty output), but
+    without the spinner, which would be interleaved with the results.
+    """
+    with status_block(ctx, opts, message, context_msg=context_msg, spin=False):
+        for results, _ in pages:
+            try:
+                print_as_ndjson(results)
+            except (TypeError, ValueError) as e:
+                click.secho("ERROR", fg="red", err=True)
+                exit_on_ndjson_error(ctx, e)
+
+
 def maybe_truncate_string(data, max_len=50):
     """Maybe truncate a string"""
     if data is not None and len(data) > max_len:
@@ -184,11 +294,41 @@ def confirm_operation(prompt, prefix=None, assume_yes=False, err=False):
 
 
 @contextmanager
-def maybe_spinner(opts):
-    """Only activate the spinner if not in debug mode."""
-    if opts.debug:
+def maybe_spinner(opts, err=False):
+    """Only activate the spinner if not in debug mode, and on a terminal.
+
+    The spinner is shown on stderr if `err` is set, so callers that print
+    their status message to stderr should pass the same flag here.
+    """
+    stream = sys.stderr if err else sys.stdout
+
+    if opts.debug or not stream.isatty():
         # No spinner
         yield
     else:
-        with spinner() as spin:
+        # Only import the spinner when it's actually going to be shown
+        from click_spinner import spinner
+
+        with spinner(stream=stream) as spin:
             yield spin
+
+
+@contextmanager
+def status_block(ctx, opts, message, context_msg=None, spin=True):
+    """Print a status message for an API operation, followed by OK on success.
+
+    The message is printed to stderr if the output is something else (e.g.
+    JSON), and any API exceptions are handled by `handle_api_exceptions`.
+    """
+    use_stderr = opts.output != "pretty"
+
+    click.echo(f"{message} ... ", nl=False, err=use_stderr)
+
+    with handle_api_exceptions(ctx, opts=opts, context_msg=context_msg):
+        if spin:
+            with maybe_spinner(opts, err=use_stderr):
+                yield
+        else:
+            yield
+
+    click.secho("OK", fg="green", err=use_stderr)
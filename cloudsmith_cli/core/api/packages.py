@@ -6,7 +6,7 @@ import cloudsmith_api
 from cloudsmith_api.models import PackageQuarantineRequest
 
 from .. import ratelimits, utils
-from ..pagination import PageInfo
+from ..pagination import PageInfo, iter_pages
 from .exceptions import catch_raise_api_exception
 from .init import get_api_client
 
@@ -233,6 +233,18 @@ def list_packages(owner, repo, **kwargs):
     return [x.to_dict() for x in data], page_info
 
 
+def iter_packages(owner, repo, page=1, page_size=None, query=None):
+    """Iterate over pages of packages for a repository."""
+    return iter_pages(
+        list_packages,
+        page=page,
+        owner=owner,
+        repo=repo,
+        page_size=page_size,
+        query=query,
+    )
+
+
 def get_package_formats():
     """Get the list of available package formats and parameters."""
 
@@ -3,7 +3,7 @@
 import cloudsmith_api
 
 from .. import ratelimits, utils
-from ..pagination import PageInfo
+from ..pagination import PageInfo, iter_pages
 from .exceptions import catch_raise_api_exception
 from .init import get_api_client
 
@@ -45,6 +45,17 @@ def list_repos(owner=None, **kwargs):
     return [x.to_dict() for x in res], page_info
 
 
+def iter_repos(owner=None, repo=None, page=1, page_size=None):
+    """Iterate over pages of repositories in a namespace."""
+    return iter_pages(
+        list_repos,
+        page=page,
+        owner=owner,
+        repo=repo,
+        page_size=page_size,
+    )
+
+
 def create_repo(owner, repo_config):
     """Create a repository in a namespace."""
     client = get_repos_api()
@@ -73,3 +73,23 @@ class PageInfo:
             info.page_total = int(headers["X-Pagination-PageTotal"])
 
         return info
+
+
+def iter_pages(fetch, page=1, **kwargs):
+    """Iterate over successive pages of results from a list endpoint.
+
+    The `fetch` callable must accept `page` (along with any other `kwargs`)
+    and return a tuple of `(results, page_info)`. Each page is yielded as soon
+    as it has been fetched, starting at `page` and continuing until the last
+    page has been reached.
+    """
+    while True:
+        results, page_info = fetch(page=page, **kwargs)
+        yield results, page_info
+
+        if not results or not page_info.is_valid:
+            break
+        if page_info.page >= page_info.page_total:
+            break
+
+        page = page_info.page + 1
@@ -0,0 +1,47 @@
+from ..pagination import PageInfo, iter_pages
+
+
+def make_fetch(num_pages, page_size=2):
+    """Return a fake list endpoint that serves `num_pages` pages of results."""
+    calls = []
+
+    def fetch(page, **kwargs):
+        calls.append(page)
+        page_info = PageInfo()
+        page_info.count = num_pages * page_size
+        page_info.page = page
+        page_info.page_size = page_size
+        page_info.page_total = num_pages
+        results = [f"{page}-{i}" for i in range(page_size)]
+        return results, page_info
+
+    return fetch, calls
+
+
+def test_iter_pages_follows_pagination_to_last_page():
+    fetch, calls = make_fetch(num_pages=3)
+    pages = list(iter_pages(fetch))
+    assert calls == [1, 2, 3]
+    assert [results for results, _ in pages][-1] == ["3-0", "3-1"]
+
+
+def test_iter_pages_starts_at_page():
+    fetch, calls = make_fetch(num_pages=5)
+    pages = list(iter_pages(fetch, page=4))
+    assert calls == [4, 5]
+    assert len(pages) == 2
+
+
+def test_iter_pages_is_lazy():
+    fetch, calls = make_fetch(num_pages=3)
+    pages = iter_pages(fetch)
+    assert calls == []
+    next(pages)
+    assert calls == [1]
+
+
+def test_iter_pages_stops_without_valid_page_info():
+    def fetch(page, **kwargs):
+        return ["result"], PageInfo()
+
+    assert len(list(iter_pages(fetch))) == 1